@@ -5,6 +5,7 @@ from pathlib import Path
 # --- Download settings ---
 DOWNLOAD_DIR = Path("./downloads")
 MAX_CONCURRENT = 3  # parallel downloads
+MAX_PER_HOST = 2  # parallel downloads per host, so one VK edge isn't hammered
 FORMAT = "bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best"
 RATE_LIMIT = None  # e.g. "5M" for 5 MB/s, None = unlimited
 
@@ -24,7 +25,14 @@ OUTPUT_TEMPLATE = "%(uploader)s/%(title)s [%(id)s].%(ext)s"
 # --- Retry / resilience ---
 RETRIES = 5
 FRAGMENT_RETRIES = 5
-RETRY_SLEEP = 5  # seconds between retries
+RETRY_SLEEP = 5  # base backoff in seconds; actual sleep is jittered exponential
+RETRY_SLEEP_MAX = 60  # cap on a single backoff sleep
+
+# --- Metadata cache ---
+# Caches yt-dlp info dicts on disk so dry-run / list-formats and the actual
+# download don't re-fetch the same metadata. Entries expire after TTL seconds.
+META_CACHE_DIR = Path.home() / ".cache" / "vk-video-downloader" / "meta"
+META_CACHE_TTL = 3600  # seconds
 
 # --- Misc ---
 WRITE_THUMBNAIL = True
@@ -11,39 +11,94 @@ Usage:
     python download.py --help
 """
 
-import argparse
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import hashlib
 import http.cookiejar
+import json
+import os
+import random
 import re
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import ChainMap, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlsplit
 from urllib.request import HTTPCookieProcessor, Request, build_opener, urlopen
 from urllib.error import URLError
 
-import yt_dlp
-from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    DownloadColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    TimeRemainingColumn,
-    TransferSpeedColumn,
-)
-from rich.table import Table
+# We don't use yt-dlp plugins, and discovering them walks sys.path and any
+# plugin dirs on import — measurable startup cost. Set before yt_dlp is
+# (lazily) imported; export YTDLP_NO_PLUGINS= (empty) to re-enable discovery.
+os.environ.setdefault("YTDLP_NO_PLUGINS", "1")
+
+# yt_dlp and rich are deliberately NOT imported here: together they dominate
+# cold start, and e.g. `download.py --help` never needs them. Each function
+# that uses them imports locally (cheap dict lookup after the first time).
 
 import config
 
-console = Console()
+
+_console = None
+
+
+def _get_console():
+    """The real shared rich Console, created (and rich imported) on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+class _LazyConsole:
+    """Stand-in for the shared rich Console that defers importing rich
+    until the first print, keeping it off the --help startup path."""
+
+    def __getattr__(self, name):
+        return getattr(_get_console(), name)
+
+
+console = _LazyConsole()
 
 
 # ---------------------------------------------------------------------------
 # yt-dlp options builder
 # ---------------------------------------------------------------------------
 
+# Maps the --quality CLI choice to a yt-dlp format string
+QUALITY_MAP = {
+    "1080": "bestvideo[height<=1080]+bestaudio/best[height<=1080]/best",
+    "720": "bestvideo[height<=720]+bestaudio/best[height<=720]/best",
+    "480": "bestvideo[height<=480]+bestaudio/best[height<=480]/best",
+    "360": "bestvideo[height<=360]+bestaudio/best[height<=360]/best",
+    "best": "bestvideo+bestaudio/best",
+    "worst": "worstvideo+worstaudio/worst",
+}
+
+# Extractors yt-dlp may consider (entries are case-insensitive regexes
+# matched against extractor names). Without this every extract_info call
+# runs the suitable() check of all ~1800 bundled extractors per URL. The
+# YouTube extractors stay enabled because the embed fallback hands
+# youtube.com URLs to the same instance, and generic is kept as a last
+# resort for odd VK embeds.
+ALLOWED_EXTRACTORS = ["vk", "vk:.*", "youtube.*", "generic"]
+
+
+def _retry_sleep(n: int) -> float:
+    """Exponential backoff with full jitter for yt-dlp retries.
+
+    A fixed sleep makes all failed workers retry in lockstep and hammer the
+    same VK edge again; jitter spreads the retries out.
+    """
+    return random.uniform(0, min(config.RETRY_SLEEP_MAX, config.RETRY_SLEEP * 2 ** n))
+
+
 def build_ydl_opts(
     download_dir: Path | None = None,
     format_str: str | None = None,
@@ -62,15 +117,7 @@ def build_ydl_opts(
 
     fmt = format_str or config.FORMAT
     if quality:
-        quality_map = {
-            "1080": "bestvideo[height<=1080]+bestaudio/best[height<=1080]/best",
-            "720": "bestvideo[height<=720]+bestaudio/best[height<=720]/best",
-            "480": "bestvideo[height<=480]+bestaudio/best[height<=480]/best",
-            "360": "bestvideo[height<=360]+bestaudio/best[height<=360]/best",
-            "best": "bestvideo+bestaudio/best",
-            "worst": "worstvideo+worstaudio/worst",
-        }
-        fmt = quality_map.get(quality, fmt)
+        fmt = QUALITY_MAP.get(quality, fmt)
 
     outtmpl = str(dl_dir / (output_template or config.OUTPUT_TEMPLATE))
 
@@ -79,7 +126,8 @@ def build_ydl_opts(
         "outtmpl": outtmpl,
         "retries": config.RETRIES,
         "fragment_retries": config.FRAGMENT_RETRIES,
-        "retry_sleep_functions": {"http": lambda n: config.RETRY_SLEEP},
+        "retry_sleep_functions": {"http": _retry_sleep, "fragment": _retry_sleep},
+        "allowed_extractors": ALLOWED_EXTRACTORS,
         "ignoreerrors": True,
         "no_warnings": quiet,
         "quiet": quiet,
@@ -122,6 +170,63 @@ def build_ydl_opts(
     return opts
 
 
+# ---------------------------------------------------------------------------
+# Metadata cache
+# ---------------------------------------------------------------------------
+
+class MetadataCache:
+    """On-disk cache of yt-dlp info dicts, keyed by sha1(url).
+
+    Avoids re-fetching the same metadata twice: once during dry-run /
+    pre-download extraction and again during the actual download.
+    Entries older than the TTL are dropped on lookup. A small in-memory
+    LRU layer in front of the files avoids re-reading and re-parsing the
+    JSON when the same URL is looked up repeatedly within one run.
+    """
+
+    MEM_MAX = 128  # in-memory LRU entries
+
+    def __init__(self, cache_dir: Path | None = None, ttl: int | None = None):
+        self.cache_dir = cache_dir or config.META_CACHE_DIR
+        self.ttl = ttl if ttl is not None else config.META_CACHE_TTL
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._mem: OrderedDict[str, dict] = OrderedDict()
+        self._mem_lock = threading.Lock()
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def _mem_put(self, url: str, info: dict):
+        with self._mem_lock:
+            self._mem[url] = info
+            self._mem.move_to_end(url)
+            while len(self._mem) > self.MEM_MAX:
+                self._mem.popitem(last=False)
+
+    def get(self, url: str) -> dict | None:
+        with self._mem_lock:
+            if url in self._mem:
+                self._mem.move_to_end(url)
+                return self._mem[url]
+        path = self._path(url)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            info = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        self._mem_put(url, info)
+        return info
+
+    def put(self, url: str, info: dict):
+        self._mem_put(url, info)
+        try:
+            self._path(url).write_text(json.dumps(info), encoding="utf-8")
+        except (OSError, TypeError, ValueError):
+            pass
+
+
 # ---------------------------------------------------------------------------
 # Single-URL download
 # ---------------------------------------------------------------------------
@@ -138,6 +243,155 @@ class DownloadResult:
         self.entries: int = 0  # number of videos (>1 for playlists)
 
 
+# The DownloadResult currently being worked on in this thread/task, so the
+# shared per-thread logger below knows where to record errors.
+_current_result: contextvars.ContextVar[DownloadResult | None] = contextvars.ContextVar(
+    "current_result", default=None
+)
+
+# One YoutubeDL per worker thread: reusing an instance keeps its urllib
+# opener (and thus TLS sessions to VK hosts) alive across downloads instead
+# of re-handshaking for every URL.
+_thread_ydl = threading.local()
+
+
+# Archive IDs buffered by the per-thread instances (see _batch_ydl_class),
+# written in a single append by flush_archive at the end of the batch.
+_archive_pending_lock = threading.Lock()
+_archive_pending: list[str] = []
+
+_batch_ydl_cls = None
+
+
+def _batch_ydl_class():
+    """Return the archive-buffering YoutubeDL subclass.
+
+    Created on first use so that importing this module doesn't pull in
+    yt_dlp. The subclass overrides record_download_archive: stock yt-dlp
+    opens, writes and closes the archive file once per finished video —
+    for batches of many small videos that's a syscall round-trip per
+    download — so new IDs are collected in ``_archive_pending`` instead.
+    """
+    global _batch_ydl_cls
+    if _batch_ydl_cls is None:
+        import yt_dlp
+
+        class _BatchArchiveYDL(yt_dlp.YoutubeDL):
+            def record_download_archive(self, info_dict):
+                if not self.params.get("download_archive"):
+                    return
+                vid_id = self._make_archive_id(info_dict)
+                if not vid_id:
+                    return
+                with _archive_pending_lock:
+                    _archive_pending.append(vid_id)
+                self.archive.add(vid_id)
+
+        _batch_ydl_cls = _BatchArchiveYDL
+    return _batch_ydl_cls
+
+
+# Cached archive-ID set, so the skip-check doesn't re-read and re-split the
+# whole archive file for every URL in a batch. Invalidated on mtime change.
+_archive_cache_lock = threading.Lock()
+_archive_cache: tuple[str, float, frozenset[str]] | None = None
+
+
+def _archive_ids(archive_path: str) -> frozenset[str]:
+    """Return the IDs in the archive file, re-reading only when it changes."""
+    global _archive_cache
+    try:
+        mtime = os.stat(archive_path).st_mtime
+    except OSError:
+        return frozenset()
+    with _archive_cache_lock:
+        cached = _archive_cache
+    if cached and cached[0] == archive_path and cached[1] == mtime:
+        return cached[2]
+    try:
+        ids = frozenset(Path(archive_path).read_text(encoding="utf-8").splitlines())
+    except OSError:
+        return frozenset()
+    with _archive_cache_lock:
+        _archive_cache = (archive_path, mtime, ids)
+    return ids
+
+
+def flush_archive(ydl_opts: dict):
+    """Append all buffered archive IDs to the archive file in one write."""
+    global _archive_pending
+    with _archive_pending_lock:
+        pending, _archive_pending = _archive_pending, []
+    archive_path = ydl_opts.get("download_archive")
+    if archive_path and pending:
+        with open(archive_path, "a", encoding="utf-8") as f:
+            f.writelines(f"{vid_id}\n" for vid_id in pending)
+
+
+class _InfoLogger:
+    """Capture yt-dlp error messages into the active DownloadResult.
+
+    Stateless: the target result comes from ``_current_result``, so a single
+    shared instance serves every thread (no per-worker class creation).
+    """
+
+    def debug(self, msg):
+        pass
+
+    def info(self, msg):
+        pass
+
+    def warning(self, msg):
+        pass
+
+    def error(self, msg):
+        result = _current_result.get()
+        if result is not None:
+            result.error = msg
+
+
+_INFO_LOGGER = _InfoLogger()
+
+# Every YoutubeDL opened for a batch, so run_batch can close them when it's
+# done: yt-dlp persists the cookie jar only in close() (close() ->
+# save_cookies()), so skipping it would lose refreshed session cookies for
+# --cookies-file users.
+_open_ydls: list = []
+_open_ydls_lock = threading.Lock()
+
+
+def _close_open_ydls():
+    """Close all per-thread YoutubeDL instances, persisting their cookies."""
+    with _open_ydls_lock:
+        open_ydls, _open_ydls[:] = list(_open_ydls), []
+    for ydl in open_ydls:
+        try:
+            ydl.close()
+        except Exception:
+            pass
+
+
+def _init_thread_ydl(ydl_opts: dict):
+    """Build this thread's YoutubeDL instance on first use.
+
+    ChainMap layers the overrides over the shared opts without copying
+    them — and any params yt-dlp mutates land in the thread's own front
+    map instead of the shared dict.
+    """
+    opts = ChainMap({"logger": _INFO_LOGGER}, ydl_opts)
+    ydl = _batch_ydl_class()(opts).__enter__()
+    with _open_ydls_lock:
+        _open_ydls.append(ydl)
+    _thread_ydl.ydl = ydl
+
+
+def _get_thread_ydl(ydl_opts: dict):
+    """Return this thread's YoutubeDL, creating it on first use."""
+    if getattr(_thread_ydl, "ydl", None) is None:
+        _init_thread_ydl(ydl_opts)
+    return _thread_ydl.ydl
+
+
 # Patterns for YouTube URLs embedded in VK pages
 _YT_RE = re.compile(
     r'(?:https?://)?(?:www\.)?'
@@ -162,6 +416,8 @@ def _extract_youtube_url(vk_url: str, ydl_opts: dict | None = None) -> str | Non
             elif ydl_opts.get("cookiesfrombrowser"):
                 # Let yt-dlp extract cookies to a temp jar
                 try:
+                    import yt_dlp
+
                     with yt_dlp.YoutubeDL({"quiet": True, "cookiesfrombrowser": ydl_opts["cookiesfrombrowser"]}) as _ydl:
                         _ydl.cookiejar  # triggers cookie loading
                         cj = _ydl.cookiejar
@@ -180,28 +436,21 @@ def _extract_youtube_url(vk_url: str, ydl_opts: dict | None = None) -> str | Non
     return None
 
 
-def download_url(url: str, ydl_opts: dict) -> DownloadResult:
-    """Download a single URL (may be a video, playlist, or channel)."""
-    result = DownloadResult(url)
+def download_url(url: str, ydl_opts: dict, meta_cache: MetadataCache | None = None) -> DownloadResult:
+    """Download a single URL (may be a video, playlist, or channel).
 
-    class InfoLogger:
-        """Capture yt-dlp info messages."""
-        def debug(self, msg):
-            pass
-        def info(self, msg):
-            pass
-        def warning(self, msg):
-            pass
-        def error(self, msg):
-            result.error = msg
+    Uses this thread's shared YoutubeDL instance so sockets stay alive
+    across downloads; the active DownloadResult is published through
+    ``_current_result`` so the shared logger captures errors correctly.
+    """
+    import yt_dlp
 
-    opts = {**ydl_opts, "logger": InfoLogger()}
-    actual_url = url  # may change to YouTube URL on fallback
+    result = DownloadResult(url)
 
     # --- Check archive: skip if already downloaded ---
     archive_path = ydl_opts.get("download_archive")
-    if archive_path and Path(archive_path).exists():
-        archive_ids = set(Path(archive_path).read_text(encoding="utf-8").splitlines())
+    if archive_path:
+        archive_ids = _archive_ids(archive_path)
         # Extract VK video ID from URL to check against archive
         vk_match = re.search(r'/video(-?\d+_\d+)', url)
         if vk_match:
@@ -212,15 +461,19 @@ def download_url(url: str, ydl_opts: dict) -> DownloadResult:
                 result.entries = 1
                 return result
 
+    ydl = _get_thread_ydl(ydl_opts)
+    token = _current_result.set(result)
     try:
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            # Extract info first (no download) to get metadata
+        # Extract info first (no download) to get metadata.
+        # Check the on-disk cache so a preceding dry-run / list-formats
+        # (or a repeat invocation) doesn't fetch the page twice.
+        info = meta_cache.get(url) if meta_cache else None
+        if info is None:
             info = ydl.extract_info(url, download=False)
             if info is None:
                 # Fallback: check if VK page embeds a YouTube video
                 yt_url = _extract_youtube_url(url, ydl_opts)
                 if yt_url:
-                    actual_url = yt_url
                     result.url = f"{url} -> {yt_url}"
                     info = ydl.extract_info(yt_url, download=False)
                     if info is None:
@@ -229,19 +482,28 @@ def download_url(url: str, ydl_opts: dict) -> DownloadResult:
                 else:
                     result.error = "Could not extract video info"
                     return result
+            if meta_cache:
+                meta_cache.put(url, ydl.sanitize_info(info))
 
-            # Check if it's a playlist / channel
-            if "entries" in info:
-                entries = list(info["entries"])
+        # Check if it's a playlist / channel
+        if "entries" in info:
+            entries = info["entries"]
+            if isinstance(entries, list):
                 result.entries = len(entries)
-                result.title = info.get("title", url)
             else:
-                result.entries = 1
-                result.title = info.get("title", url)
+                # Lazy playlist: materializing the generator would resolve
+                # every entry up front (and exhaust it before the download),
+                # so take the count from the playlist metadata instead
+                result.entries = info.get("playlist_count") or 0
+            result.title = info.get("title", url)
+        else:
+            result.entries = 1
+            result.title = info.get("title", url)
 
-            # Download
-            ydl.download([actual_url])
-            result.success = True
+        # Download, reusing the already-fetched info dict so yt-dlp
+        # doesn't hit the network for metadata a second time
+        ydl.process_ie_result(info, download=True)
+        result.success = True
 
     except yt_dlp.utils.DownloadError as e:
         # Fallback: try YouTube extraction on download errors too
@@ -250,19 +512,20 @@ def download_url(url: str, ydl_opts: dict) -> DownloadResult:
             if yt_url:
                 try:
                     result.url = f"{url} -> {yt_url}"
-                    with yt_dlp.YoutubeDL(opts) as ydl2:
-                        info = ydl2.extract_info(yt_url, download=False)
-                        if info:
-                            result.title = info.get("title", yt_url)
-                            result.entries = 1
-                            ydl2.download([yt_url])
-                            result.success = True
-                            return result
+                    info = ydl.extract_info(yt_url, download=False)
+                    if info:
+                        result.title = info.get("title", yt_url)
+                        result.entries = 1
+                        ydl.process_ie_result(info, download=True)
+                        result.success = True
+                        return result
                 except Exception:
                     pass
         result.error = str(e)
     except Exception as e:
         result.error = str(e)
+    finally:
+        _current_result.reset(token)
 
     return result
 
@@ -271,51 +534,154 @@ def download_url(url: str, ydl_opts: dict) -> DownloadResult:
 # Batch orchestrator
 # ---------------------------------------------------------------------------
 
-def run_batch(urls: list[str], ydl_opts: dict, max_concurrent: int) -> list[DownloadResult]:
+# How often buffered progress advances / result lines are flushed to the
+# terminal in concurrent mode. Per-completion rendering gets expensive when
+# many small downloads finish at once.
+_PROGRESS_FLUSH_INTERVAL = 0.25  # seconds
+
+# In serial mode, buffered archive IDs are flushed every N URLs so a killed
+# process (SIGTERM, OOM, crash — anything that skips the finally) loses at
+# most the last N records instead of the whole batch. Concurrent mode
+# flushes from the timer task instead, bounding the loss to one interval.
+_ARCHIVE_FLUSH_EVERY = 32  # URLs
+
+
+def run_batch(
+    urls: list[str],
+    ydl_opts: dict,
+    max_concurrent: int,
+    meta_cache: MetadataCache | None = None,
+    max_per_host: int = config.MAX_PER_HOST,
+) -> list[DownloadResult]:
     """Download multiple URLs with concurrency and progress display."""
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TextColumn,
+        TimeRemainingColumn,
+    )
+
     results: list[DownloadResult] = []
 
-    with Progress(
+    progress_cm = Progress(
         SpinnerColumn(),
         TextColumn("[bold blue]{task.description}"),
         BarColumn(),
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         TimeRemainingColumn(),
-        console=console,
-    ) as progress:
-        overall = progress.add_task("Overall", total=len(urls))
-
-        if max_concurrent <= 1:
-            for url in urls:
-                progress.update(overall, description=f"Downloading ({urls.index(url)+1}/{len(urls)})")
-                r = download_url(url, ydl_opts)
-                results.append(r)
-                progress.advance(overall)
-                if r.success:
-                    console.print(f"  [green]✓[/] {r.title} ({r.entries} video(s))")
-                else:
-                    console.print(f"  [red]✗[/] {url}: {r.error}")
-        else:
-            with ThreadPoolExecutor(max_workers=max_concurrent) as pool:
-                futures = {pool.submit(download_url, u, ydl_opts): u for u in urls}
-                for future in as_completed(futures):
-                    r = future.result()
+        console=_get_console(),
+        refresh_per_second=8,  # default 12.5; the bar doesn't need more
+    )
+    try:
+        with progress_cm as progress:
+            overall = progress.add_task("Overall", total=len(urls))
+
+            if max_concurrent <= 1:
+                for i, url in enumerate(urls, 1):
+                    progress.update(overall, description=f"Downloading ({i}/{len(urls)})")
+                    r = download_url(url, ydl_opts, meta_cache)
                     results.append(r)
                     progress.advance(overall)
                     if r.success:
                         console.print(f"  [green]✓[/] {r.title} ({r.entries} video(s))")
                     else:
-                        console.print(f"  [red]✗[/] {r.url}: {r.error}")
+                        console.print(f"  [red]✗[/] {url}: {r.error}")
+                    if i % _ARCHIVE_FLUSH_EVERY == 0:
+                        flush_archive(ydl_opts)
+            else:
+                asyncio.run(_run_batch_async(
+                    urls, ydl_opts, max_concurrent, max_per_host,
+                    meta_cache, progress, overall, results,
+                ))
+    finally:
+        # One append for all newly downloaded IDs instead of a write per video
+        flush_archive(ydl_opts)
+        # Close the per-thread instances so yt-dlp saves refreshed cookies
+        _close_open_ydls()
 
     return results
 
 
+async def _run_batch_async(
+    urls: list[str],
+    ydl_opts: dict,
+    max_concurrent: int,
+    max_per_host: int,
+    meta_cache: MetadataCache | None,
+    progress: Progress,
+    overall,
+    results: list[DownloadResult],
+):
+    """Run downloads concurrently, bounded by a semaphore.
+
+    yt-dlp itself is blocking, so each download runs in a worker thread via
+    asyncio.to_thread; the semaphore caps how many are in flight at once
+    (the per-thread YoutubeDL instances are created lazily in each worker).
+    A second, per-host semaphore keeps at most max_per_host downloads going
+    against any single VK edge server.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def host_semaphore(url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).hostname or ""
+        sem = host_semaphores.get(host)
+        if sem is None:
+            sem = host_semaphores[host] = asyncio.Semaphore(max_per_host)
+        return sem
+
+    # Completions are buffered and flushed on a timer: one advance() and one
+    # print() per interval instead of a render per finished download
+    pending_lines: list[str] = []
+    pending_advance = 0
+
+    def flush():
+        nonlocal pending_advance
+        if pending_advance:
+            progress.advance(overall, pending_advance)
+            pending_advance = 0
+        if pending_lines:
+            console.print("\n".join(pending_lines))
+            pending_lines.clear()
+
+    async def worker(url: str):
+        nonlocal pending_advance
+        async with semaphore, host_semaphore(url):
+            r = await asyncio.to_thread(download_url, url, ydl_opts, meta_cache)
+        results.append(r)
+        pending_advance += 1
+        if r.success:
+            pending_lines.append(f"  [green]✓[/] {r.title} ({r.entries} video(s))")
+        else:
+            pending_lines.append(f"  [red]✗[/] {r.url}: {r.error}")
+
+    async def flusher():
+        while True:
+            await asyncio.sleep(_PROGRESS_FLUSH_INTERVAL)
+            flush()
+            # Also persist buffered archive IDs: if the process is killed
+            # before run_batch's finally, at most one interval's worth of
+            # completions is lost (flush_archive is lock-protected and
+            # append-only, so a mid-batch call is safe; no-op when empty)
+            flush_archive(ydl_opts)
+
+    flush_task = asyncio.create_task(flusher())
+    try:
+        await asyncio.gather(*(worker(u) for u in urls))
+    finally:
+        flush_task.cancel()
+        flush()
+
+
 # ---------------------------------------------------------------------------
 # Summary table
 # ---------------------------------------------------------------------------
 
 def print_summary(results: list[DownloadResult]):
     """Print a summary table after all downloads."""
+    from rich.table import Table
+
     table = Table(title="Download Summary", show_lines=True)
     table.add_column("#", style="dim", width=4)
     table.add_column("Title / URL", max_width=60)
@@ -382,18 +748,25 @@ def save_log(results: list[DownloadResult], elapsed: float, log_dir: Path | None
 # CLI
 # ---------------------------------------------------------------------------
 
-def parse_args() -> argparse.Namespace:
-    p = argparse.ArgumentParser(
-        description="VK Video Mass Downloader — batch download from vkvideo.ru",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   %(prog)s https://vkvideo.ru/video4725344_14264835
   %(prog)s https://vkvideo.ru/@channel
   %(prog)s https://vkvideo.ru/playlist/-204353299_426
   %(prog)s -f urls.txt --quality 720
   %(prog)s -f urls.txt --cookies-browser firefox --concurrent 5
-        """,
+"""
+
+
+def parse_args() -> argparse.Namespace:
+    # Imported lazily: argparse is only needed when running as a CLI, not
+    # when this module is imported for its download helpers
+    import argparse
+
+    p = argparse.ArgumentParser(
+        description="VK Video Mass Downloader — batch download from vkvideo.ru",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
     p.add_argument("urls", nargs="*", help="One or more VK video / channel / playlist URLs")
     p.add_argument("-f", "--file", type=Path, help="Text file with URLs (one per line)")
@@ -401,7 +774,12 @@ Examples:
     p.add_argument("-q", "--quality", choices=["best", "1080", "720", "480", "360", "worst"],
                    default=None, help="Video quality (default: best available)")
     p.add_argument("-c", "--concurrent", type=int, default=config.MAX_CONCURRENT,
-                   help=f"Max parallel downloads (default: {config.MAX_CONCURRENT})")
+                   help=f"Max parallel downloads (default: {config.MAX_CONCURRENT}); "
+                        "also capped per host, see --per-host-concurrent")
+    p.add_argument("--per-host-concurrent", type=int, default=config.MAX_PER_HOST,
+                   help=f"Max parallel downloads per host (default: {config.MAX_PER_HOST}). "
+                        "Most VK URLs share the vkvideo.ru host, so raise this "
+                        "together with --concurrent")
     p.add_argument("--cookies-browser", type=str, default=None,
                    help=f"Browser for cookie extraction (default: {config.COOKIES_BROWSER})")
     p.add_argument("--cookies-file", type=Path, default=None,
@@ -410,6 +788,10 @@ Examples:
                    help="Don't track downloaded videos (re-download everything)")
     p.add_argument("--rate-limit", type=str, default=None,
                    help="Download speed limit, e.g. '5M' for 5 MB/s")
+    p.add_argument("--no-meta-cache", action="store_true",
+                   help="Don't cache video metadata between runs")
+    p.add_argument("--meta-cache-ttl", type=int, default=config.META_CACHE_TTL,
+                   help=f"Metadata cache lifetime in seconds (default: {config.META_CACHE_TTL})")
     p.add_argument("--list-formats", action="store_true",
                    help="List available formats for given URLs, don't download")
     p.add_argument("--dry-run", action="store_true",
@@ -426,29 +808,24 @@ def collect_urls(args: argparse.Namespace) -> list[str]:
             console.print(f"[red]Error:[/red] File not found: {args.file}")
             sys.exit(1)
         with open(args.file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    urls.append(line)
+            urls.extend(
+                stripped for line in f
+                if (stripped := line.strip()) and not stripped.startswith("#")
+            )
 
     if not urls:
         console.print("[red]Error:[/red] No URLs provided. Use positional args or -f FILE.")
         sys.exit(1)
 
     # Deduplicate while preserving order
-    seen = set()
-    unique = []
-    for u in urls:
-        if u not in seen:
-            seen.add(u)
-            unique.append(u)
-
-    return unique
+    return list(dict.fromkeys(urls))
 
 
 def list_formats(urls: list[str], ydl_opts: dict):
     """List available formats for each URL."""
-    opts = {**ydl_opts, "listformats": True}
+    import yt_dlp
+
+    opts = ChainMap({"listformats": True}, ydl_opts)
     with yt_dlp.YoutubeDL(opts) as ydl:
         for url in urls:
             console.print(f"\n[bold]{url}[/bold]")
@@ -458,9 +835,52 @@ def list_formats(urls: list[str], ydl_opts: dict):
                 pass
 
 
-def dry_run(urls: list[str], ydl_opts: dict):
-    """Extract info without downloading."""
-    opts = {**ydl_opts, "quiet": True, "no_warnings": True}
+def dry_run(
+    urls: list[str],
+    ydl_opts: dict,
+    meta_cache: MetadataCache | None = None,
+    max_concurrent: int = config.MAX_CONCURRENT,
+):
+    """Extract info without downloading.
+
+    Extraction is network-bound, so URLs are fetched concurrently (one
+    YoutubeDL per worker thread); the table keeps the input order.
+    """
+    import yt_dlp
+    from rich.table import Table
+
+    base_opts = ChainMap({"quiet": True, "no_warnings": True}, ydl_opts)
+    local = threading.local()
+    created: list = []  # per-thread instances, closed below to save cookies
+    created_lock = threading.Lock()
+
+    def fetch(url: str) -> tuple[str, dict | None, Exception | None]:
+        ydl = getattr(local, "ydl", None)
+        if ydl is None:
+            # each thread's instance gets its own writable front map
+            ydl = local.ydl = yt_dlp.YoutubeDL(base_opts.new_child())
+            with created_lock:
+                created.append(ydl)
+        info = meta_cache.get(url) if meta_cache else None
+        if info is None:
+            try:
+                info = ydl.extract_info(url, download=False)
+            except Exception as e:
+                return url, None, e
+            if info is not None and meta_cache:
+                meta_cache.put(url, ydl.sanitize_info(info))
+        return url, info, None
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(max_concurrent, 1)) as pool:
+            fetched = list(pool.map(fetch, urls))  # map preserves input order
+    finally:
+        for ydl in created:
+            try:
+                ydl.close()
+            except Exception:
+                pass
+
     table = Table(title="Dry Run — Videos to Download")
     table.add_column("#", style="dim", width=4)
     table.add_column("Title", max_width=50)
@@ -468,28 +888,26 @@ def dry_run(urls: list[str], ydl_opts: dict):
     table.add_column("URL", max_width=50)
 
     idx = 0
-    with yt_dlp.YoutubeDL(opts) as ydl:
-        for url in urls:
-            try:
-                info = ydl.extract_info(url, download=False)
-                if info is None:
+    for url, info, err in fetched:
+        if err is not None:
+            idx += 1
+            table.add_row(str(idx), f"[red]ERROR[/red]", "-", f"{url} ({err})")
+            continue
+        if info is None:
+            continue
+        if "entries" in info:
+            for entry in info["entries"]:
+                if entry is None:
                     continue
-                if "entries" in info:
-                    for entry in info["entries"]:
-                        if entry is None:
-                            continue
-                        idx += 1
-                        dur = entry.get("duration")
-                        dur_str = f"{int(dur//60)}:{int(dur%60):02d}" if dur else "?"
-                        table.add_row(str(idx), entry.get("title", "?"), dur_str, entry.get("webpage_url", url))
-                else:
-                    idx += 1
-                    dur = info.get("duration")
-                    dur_str = f"{int(dur//60)}:{int(dur%60):02d}" if dur else "?"
-                    table.add_row(str(idx), info.get("title", "?"), dur_str, info.get("webpage_url", url))
-            except Exception as e:
                 idx += 1
-                table.add_row(str(idx), f"[red]ERROR[/red]", "-", f"{url} ({e})")
+                dur = entry.get("duration")
+                dur_str = f"{int(dur//60)}:{int(dur%60):02d}" if dur else "?"
+                table.add_row(str(idx), entry.get("title", "?"), dur_str, entry.get("webpage_url", url))
+        else:
+            idx += 1
+            dur = info.get("duration")
+            dur_str = f"{int(dur//60)}:{int(dur%60):02d}" if dur else "?"
+            table.add_row(str(idx), info.get("title", "?"), dur_str, info.get("webpage_url", url))
 
     console.print(table)
     console.print(f"\n[bold]Total:[/bold] {idx} video(s) found")
@@ -517,16 +935,23 @@ def main():
         no_archive=args.no_archive,
     )
 
+    meta_cache = None if args.no_meta_cache else MetadataCache(ttl=args.meta_cache_ttl)
+
     if args.list_formats:
         list_formats(urls, ydl_opts)
         return
 
     if args.dry_run:
-        dry_run(urls, ydl_opts)
+        dry_run(urls, ydl_opts, meta_cache, max_concurrent=args.concurrent)
         return
 
     t0 = time.time()
-    results = run_batch(urls, ydl_opts, max_concurrent=args.concurrent)
+    results = run_batch(
+        urls, ydl_opts,
+        max_concurrent=args.concurrent,
+        meta_cache=meta_cache,
+        max_per_host=args.per_host_concurrent,
+    )
     elapsed = time.time() - t0
 
     print_summary(results)
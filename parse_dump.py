@@ -9,33 +9,82 @@ Usage:
 """
 
 import argparse
+import mmap
 import re
 import sys
 from pathlib import Path
 
+# Optional: Hyperscan JIT-compiles the pattern to a DFA and scans with SIMD,
+# which is an order of magnitude faster than re on multi-hundred-MB dumps.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 # Matches: https://vkvideo.ru/video{owner_id}_{video_id}
 # owner_id can be negative (group) or positive (user)
-VIDEO_RE = re.compile(r'https://vkvideo\.ru/video-?\d+_\d+')
+# Bytes pattern: we scan the raw (mmapped) file instead of a decoded str,
+# so a multi-hundred-MB dump is never copied into Python memory.
+VIDEO_RE = re.compile(rb'https://vkvideo\.ru/video(?P<owner>-?\d+)_\d+')
+
+_HS_DB = None
+
+
+def _hyperscan_db():
+    """Compile the Hyperscan database once and reuse it."""
+    global _HS_DB
+    if _HS_DB is None:
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[rb'https://vkvideo\.ru/video-?\d+_\d+'],
+            ids=[0],
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST],
+        )
+    return _HS_DB
+
+
+def _find_match_starts(html: bytes | mmap.mmap) -> list[int]:
+    """Scan with Hyperscan and return sorted, unique match start offsets.
+
+    Hyperscan reports a match at every valid end offset, so the callback
+    only records start positions; the caller re-matches VIDEO_RE at each
+    start to recover the maximal match (and the owner group).
+    """
+    starts: set[int] = set()
 
+    def on_match(_id, frm, _to, _flags, _ctx):
+        starts.add(frm)
 
-def extract_urls(html: str, owner_filter: str | None = None) -> list[str]:
-    """Extract unique video URLs from HTML, preserving first-seen order."""
-    urls = VIDEO_RE.findall(html)
+    _hyperscan_db().scan(html, match_event_handler=on_match)
+    return sorted(starts)
 
-    # Deduplicate, preserving order
-    seen = set()
-    unique = []
-    for url in urls:
+
+def iter_urls(html: bytes | mmap.mmap, owner_filter: str | None = None):
+    """Yield unique video URLs from raw HTML bytes in first-seen order.
+
+    Match, owner-filter and dedup are fused into one pass, so callers can
+    stream results (write them out as they're found) without the full URL
+    list ever being materialized. Only the matched substrings (pure ASCII)
+    are decoded.
+    """
+    owner = owner_filter.encode("ascii") if owner_filter else None
+    if hyperscan is not None:
+        candidates = (VIDEO_RE.match(html, frm) for frm in _find_match_starts(html))
+    else:
+        candidates = VIDEO_RE.finditer(html)
+    seen: set[bytes] = set()
+    for m in candidates:
+        if m is None or (owner is not None and m["owner"] != owner):
+            continue
+        url = m.group(0)
         if url not in seen:
             seen.add(url)
-            if owner_filter:
-                # video{owner}_{id} — extract owner part
-                match = re.search(r'/video(-?\d+)_', url)
-                if match and match.group(1) != owner_filter:
-                    continue
-            unique.append(url)
+            yield url.decode("ascii")
 
-    return unique
+
+def extract_urls(html: bytes | mmap.mmap, owner_filter: str | None = None) -> list[str]:
+    """Extract unique video URLs from raw HTML bytes, preserving first-seen order."""
+    return list(iter_urls(html, owner_filter))
 
 
 def main():
@@ -50,21 +99,37 @@ def main():
         print(f"Error: {args.html} not found", file=sys.stderr)
         sys.exit(1)
 
-    html = args.html.read_text(encoding="utf-8", errors="ignore")
-    urls = extract_urls(html, owner_filter=args.owner)
-
+    # mmap instead of read_text: the OS pages the file in on demand and we
+    # never build a decoded str copy (2-4x the byte size for big dumps).
+    # URLs are streamed straight to the output as the scan finds them.
+    with open(args.html, "rb") as f:
+        size = args.html.stat().st_size
+        if size == 0:
+            urls = iter(())
+            _stream_output(urls, args)
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                _stream_output(iter_urls(mm, owner_filter=args.owner), args)
+
+
+def _stream_output(urls, args):
+    """Write URLs as they're produced; never holds the full list."""
     if args.count:
-        print(len(urls))
+        print(sum(1 for _ in urls))
         return
 
-    text = "\n".join(urls) + "\n"
-
+    count = 0
     if args.output:
-        args.output.write_text(text, encoding="utf-8")
-        print(f"Saved {len(urls)} URLs to {args.output}", file=sys.stderr)
+        with open(args.output, "w", encoding="utf-8") as out:
+            for url in urls:
+                out.write(url + "\n")
+                count += 1
+        print(f"Saved {count} URLs to {args.output}", file=sys.stderr)
     else:
-        print(text, end="")
-        print(f"\n# Total: {len(urls)} unique videos", file=sys.stderr)
+        for url in urls:
+            print(url)
+            count += 1
+        print(f"\n# Total: {count} unique videos", file=sys.stderr)
 
 
 if __name__ == "__main__":